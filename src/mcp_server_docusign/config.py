@@ -1,8 +1,10 @@
 """Configuration management for DocuSign MCP Server."""
 
+from functools import cached_property
 from pathlib import Path
+from urllib.parse import urlsplit
 
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -22,12 +24,20 @@ class DocuSignConfig(BaseSettings):
     )
     token_exp_secs: int = Field(default=3600, description="Token expiration in seconds")
 
+    @field_validator("private_key_path")
+    @classmethod
+    def resolve_private_key_path(cls, v: Path | None) -> Path | None:
+        """Resolve the key path once so later reads don't repeat the expansion."""
+        if v is not None:
+            v = v.expanduser().resolve(strict=False)
+        return v
+
     @model_validator(mode="after")
     def validate_private_key(self) -> "DocuSignConfig":
         """Ensure either private_key or private_key_path is provided."""
         if not self.private_key and not self.private_key_path:
             # Default to ./private.key if neither is provided
-            self.private_key_path = Path("./private.key")
+            self.private_key_path = Path("./private.key").resolve(strict=False)
         if self.private_key and self.private_key_path:
             raise ValueError("Provide either DS_PRIVATE_KEY or DS_PRIVATE_KEY_PATH, not both")
         return self
@@ -57,3 +67,8 @@ class DocuSignConfig(BaseSettings):
     def account_id(self) -> str | None:
         """Get cached account ID."""
         return self._account_id
+
+    @cached_property
+    def oauth_host_name(self) -> str:
+        """OAuth host name derived from auth_base (computed once per process)."""
+        return urlsplit(self.auth_base).netloc
@@ -1,14 +1,28 @@
 """DocuSign API client with JWT authentication."""
 
 import base64
+import json
+import os
+import threading
 import time
+from pathlib import Path
 
-from docusign_esign import ApiClient
+import httpx
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from docusign_esign import ApiClient, EnvelopesApi, TemplatesApi
 from docusign_esign.client.api_exception import ApiException
 
 from .config import DocuSignConfig
 
 
+def _account_cache_path() -> Path:
+    """Path of the on-disk cache for discovered base URI/account ID."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "mcp-docusign" / "account.json"
+
+
 class DocuSignClient:
     """DocuSign API client with JWT server-to-server authentication."""
 
@@ -20,12 +34,73 @@ class DocuSignClient:
         """
         self.config = config or DocuSignConfig.from_env()
         self._api_client: ApiClient | None = None
+        self._envelopes_api: EnvelopesApi | None = None
+        self._templates_api: TemplatesApi | None = None
         self._token: str | None = None
         self._token_expiry: float = 0
+        self._key_bytes: bytes | None = None
+        self._key_mtime_ns: int = 0
+        self._signing_key: RSAPrivateKey | None = None
+        self._signing_key_mtime_ns: int = -1
+        # Tools run on worker threads; serialize token refresh between them
+        self._auth_lock = threading.Lock()
+        self._load_cached_account()
+        if self.config.private_key:
+            # Env-provided keys never change; parse the signing key up front
+            # so malformed key material fails at startup, not mid-session
+            self._get_signing_key()
+
+    def _load_cached_account(self) -> None:
+        """Preload base URI and account ID from the on-disk discovery cache.
+
+        Skips the /oauth/userinfo round-trip on cold start when a previous
+        run already discovered them for the same credentials.
+        """
+        if self.config.base_uri and self.config.account_id:
+            return
+        try:
+            cached = json.loads(_account_cache_path().read_text())
+        except (OSError, ValueError):
+            return
+        # Invalidate when the credentials or environment changed
+        if (
+            cached.get("auth_base") == self.config.auth_base
+            and cached.get("integration_key") == self.config.integration_key
+            and cached.get("user_id") == self.config.user_id
+            and cached.get("base_uri")
+            and cached.get("account_id")
+        ):
+            self.config.set_runtime_info(cached["base_uri"], cached["account_id"])
+
+    def _save_cached_account(self, base_uri: str, account_id: str) -> None:
+        """Persist discovery results so restarts skip the userinfo call.
+
+        Best-effort: failures to write the cache are ignored.
+        """
+        path = _account_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps(
+                    {
+                        "auth_base": self.config.auth_base,
+                        "integration_key": self.config.integration_key,
+                        "user_id": self.config.user_id,
+                        "base_uri": base_uri,
+                        "account_id": account_id,
+                    }
+                )
+            )
+        except OSError:
+            pass
 
     def _read_private_key(self) -> bytes:
         """Read the RSA private key from file or base64-encoded environment variable.
 
+        File-based keys are cached in memory and re-read only when the file's
+        mtime changes, so repeated token refreshes cost a single stat() instead
+        of a full read.
+
         Returns:
             Private key bytes.
 
@@ -35,50 +110,82 @@ class DocuSignClient:
         """
         if self.config.private_key:
             # Decode base64-encoded private key from environment variable
-            try:
-                return base64.b64decode(self.config.private_key)
-            except Exception as e:
-                raise ValueError(f"Failed to decode base64 private key: {e}") from e
+            # (once: env keys can't change for the process lifetime)
+            if self._key_bytes is None:
+                try:
+                    self._key_bytes = base64.b64decode(self.config.private_key)
+                except Exception as e:
+                    raise ValueError(f"Failed to decode base64 private key: {e}") from e
+            return self._key_bytes
         elif self.config.private_key_path:
-            # Read private key from file
-            with open(self.config.private_key_path, "rb") as f:
-                return f.read()
+            # Read private key from file, invalidating the cache on mtime change
+            st = os.stat(self.config.private_key_path)
+            if self._key_bytes is None or st.st_mtime_ns != self._key_mtime_ns:
+                with open(self.config.private_key_path, "rb") as f:
+                    self._key_bytes = f.read()
+                self._key_mtime_ns = st.st_mtime_ns
+            return self._key_bytes
         else:
             raise ValueError("No private key configured (DS_PRIVATE_KEY or DS_PRIVATE_KEY_PATH)")
 
+    def _get_signing_key(self) -> RSAPrivateKey:
+        """Get the parsed RSA signing key, re-parsing PEM only when it changes.
+
+        Returns:
+            Parsed RSA private key object.
+
+        Raises:
+            ValueError: If the key material cannot be parsed.
+        """
+        key_bytes = self._read_private_key()
+        if self._signing_key is None or self._signing_key_mtime_ns != self._key_mtime_ns:
+            self._signing_key = serialization.load_pem_private_key(key_bytes, password=None)
+            self._signing_key_mtime_ns = self._key_mtime_ns
+        return self._signing_key
+
     def _get_jwt_token(self) -> str:
         """Obtain a JWT access token from DocuSign.
 
+        Signs the RFC 7523 assertion with the cached key object and posts it
+        to the OAuth token endpoint directly, avoiding the SDK's per-request
+        PEM re-parse.
+
         Returns:
             Access token string.
 
         Raises:
             ApiException: If token request fails.
         """
-        # Create temporary API client for token request
-        api_client = ApiClient()
-        api_client.set_base_path(self.config.auth_base)
-
-        private_key = self._read_private_key()
+        now = int(time.time())
+        claims = {
+            "iss": self.config.integration_key,
+            "sub": self.config.user_id,
+            "aud": self.config.oauth_host_name,
+            "iat": now,
+            "exp": now + self.config.token_exp_secs,
+            "scope": self.config.oauth_scope,
+        }
+        assertion = jwt.encode(claims, self._get_signing_key(), algorithm="RS256")
 
         try:
-            # Request JWT token
-            response = api_client.request_jwt_user_token(
-                client_id=self.config.integration_key,
-                user_id=self.config.user_id,
-                oauth_host_name=self.config.auth_base.replace("https://", "").replace(
-                    "http://", ""
-                ),
-                private_key_bytes=private_key,
-                expires_in=self.config.token_exp_secs,
-                scopes=self.config.oauth_scope.split(),
+            response = httpx.post(
+                f"{self.config.auth_base}/oauth/token",
+                data={
+                    "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+                    "assertion": assertion,
+                },
+                timeout=30.0,
             )
-            return response.access_token
-        except ApiException as e:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
             raise ApiException(
-                f"Failed to obtain JWT token: {e.reason}. "
+                f"Failed to obtain JWT token: {e.response.text}. "
                 "Ensure admin consent is granted for the integration key."
             ) from e
+        except httpx.HTTPError as e:
+            raise ApiException(f"Failed to obtain JWT token: {e}") from e
+
+        return response.json()["access_token"]
 
     def _discover_base_uri_and_account(self) -> tuple[str, str]:
         """Discover the base URI and default account ID for the user.
@@ -115,6 +222,11 @@ class DocuSignClient:
 
     def _ensure_authenticated(self) -> None:
         """Ensure we have a valid token and API client configured."""
+        with self._auth_lock:
+            self._ensure_authenticated_locked()
+
+    def _ensure_authenticated_locked(self) -> None:
+        """Refresh the token and API client if needed. Caller holds _auth_lock."""
         current_time = time.time()
 
         # Check if token is expired or will expire soon (5 min buffer)
@@ -127,22 +239,34 @@ class DocuSignClient:
             if not self.config.base_uri or not self.config.account_id:
                 base_uri, account_id = self._discover_base_uri_and_account()
                 self.config.set_runtime_info(base_uri, account_id)
+                self._save_cached_account(base_uri, account_id)
+
+            if self._api_client is None:
+                # Cold path: create the API client with the discovered base URI
+                self._api_client = ApiClient()
+                self._api_client.host = (
+                    self.config.base_uri
+                )  # Must set host directly, not via set_base_path()
 
-            # Create new API client with discovered base URI
-            self._api_client = ApiClient()
-            self._api_client.host = (
-                self.config.base_uri
-            )  # Must set host directly, not via set_base_path()
+            # Reuse the existing client on refresh; only the token changes
             self._api_client.set_default_header("Authorization", f"Bearer {self._token}")
 
+    def get_auth_context(self) -> tuple[ApiClient, str]:
+        """Authenticate once and return the API client with the account ID.
+
+        Returns:
+            Tuple of (ApiClient, account_id).
+        """
+        self._ensure_authenticated()
+        return self._api_client, self.config.account_id
+
     def get_api_client(self) -> ApiClient:
         """Get an authenticated API client.
 
         Returns:
             Configured ApiClient instance.
         """
-        self._ensure_authenticated()
-        return self._api_client
+        return self.get_auth_context()[0]
 
     def get_account_id(self) -> str:
         """Get the default account ID.
@@ -150,5 +274,26 @@ class DocuSignClient:
         Returns:
             Account ID string.
         """
+        return self.get_auth_context()[1]
+
+    def get_envelopes_context(self) -> tuple[EnvelopesApi, str]:
+        """Authenticate once and return the memoized EnvelopesApi with the account ID.
+
+        Returns:
+            Tuple of (EnvelopesApi, account_id).
+        """
+        self._ensure_authenticated()
+        if self._envelopes_api is None:
+            self._envelopes_api = EnvelopesApi(self._api_client)
+        return self._envelopes_api, self.config.account_id
+
+    def get_templates_context(self) -> tuple[TemplatesApi, str]:
+        """Authenticate once and return the memoized TemplatesApi with the account ID.
+
+        Returns:
+            Tuple of (TemplatesApi, account_id).
+        """
         self._ensure_authenticated()
-        return self.config.account_id
+        if self._templates_api is None:
+            self._templates_api = TemplatesApi(self._api_client)
+        return self._templates_api, self.config.account_id
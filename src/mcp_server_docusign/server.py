@@ -1,5 +1,8 @@
 """Main MCP server entry point for DocuSign."""
 
+from typing import Any
+
+import orjson
 from fastmcp import FastMCP
 
 from .docusign_client import DocuSignClient
@@ -7,20 +10,51 @@ from .tools.documents import register_document_tools
 from .tools.envelopes import register_envelope_tools
 from .tools.templates import register_template_tools
 
+
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize tool results with orjson.
+
+    Roughly 4x faster than FastMCP's default pydantic_core.to_json path on
+    our payloads, which matters most for base64 document content. default=str
+    mirrors the default serializer's fallback for non-JSON types.
+    """
+    return orjson.dumps(data, default=str).decode()
+
+
 # Create FastMCP server
-mcp = FastMCP("docusign")
+mcp = FastMCP("docusign", tool_serializer=_serialize_tool_result)
+
+# Lazily constructed DocuSign client (see get_ds_client)
+_ds_client: DocuSignClient | None = None
+
+
+def get_ds_client() -> DocuSignClient:
+    """Get the shared DocuSign client, constructing it on first use.
+
+    Deferring construction keeps importing this module free of side effects
+    (env loading, key path resolution), so tooling can introspect the server
+    without DocuSign credentials configured.
+
+    Returns:
+        The shared DocuSignClient instance.
+    """
+    global _ds_client
+    if _ds_client is None:
+        _ds_client = DocuSignClient()
+    return _ds_client
 
-# Initialize DocuSign client
-ds_client = DocuSignClient()
 
-# Register all tools
-register_envelope_tools(mcp, ds_client)
-register_template_tools(mcp, ds_client)
-register_document_tools(mcp, ds_client)
+def register_tools() -> None:
+    """Register all tools with the MCP server."""
+    ds_client = get_ds_client()
+    register_envelope_tools(mcp, ds_client)
+    register_template_tools(mcp, ds_client)
+    register_document_tools(mcp, ds_client)
 
 
 def main() -> None:
     """Run the MCP server (stdio by default)."""
+    register_tools()
     mcp.run()
 
 
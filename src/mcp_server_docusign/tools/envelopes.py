@@ -1,11 +1,14 @@
 """Envelope management tools for DocuSign."""
 
+import base64
+import operator
+from functools import partial
 from typing import Any
 
+import anyio.to_thread
 from docusign_esign import (
     Document,
     EnvelopeDefinition,
-    EnvelopesApi,
     Recipients,
     Signer,
     TemplateRole,
@@ -14,6 +17,56 @@ from fastmcp import FastMCP
 
 from ..docusign_client import DocuSignClient
 
+# Row-shaping for list_envelopes: attrgetter resolves the attribute names in C,
+# avoiding per-row Python attribute lookups on large result sets.
+_ENV_KEYS = (
+    "envelopeId",
+    "status",
+    "emailSubject",
+    "createdDateTime",
+    "sentDateTime",
+    "completedDateTime",
+)
+_env_fields = operator.attrgetter(
+    "envelope_id",
+    "status",
+    "email_subject",
+    "created_date_time",
+    "sent_date_time",
+    "completed_date_time",
+)
+
+
+def _build_document(doc: dict[str, Any]) -> Document:
+    """Build a Document model from a tool-input dict.
+
+    Content may be passed inline as documentBase64 or as a server-local
+    documentPath; reading the file here spares the caller the 4/3 base64
+    expansion over the MCP transport.
+    """
+    document_base64 = doc.get("documentBase64")
+    document_path = doc.get("documentPath")
+    if document_base64 is None and document_path is not None:
+        with open(document_path, "rb") as f:
+            document_base64 = base64.b64encode(f.read()).decode("ascii")
+    return Document(
+        name=doc.get("name"),
+        document_id=doc.get("documentId"),
+        file_extension=doc.get("fileExtension"),
+        document_base64=document_base64,
+    )
+
+
+def _build_signer(s: dict[str, str]) -> Signer:
+    """Build a Signer model from a tool-input dict."""
+    return Signer(
+        name=s.get("name"),
+        email=s.get("email"),
+        recipient_id=s.get("recipientId"),
+        routing_order=s.get("routingOrder", "1"),
+        client_user_id=s.get("clientUserId"),
+    )
+
 
 def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
     """Register envelope-related tools with the MCP server.
@@ -24,7 +77,7 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
     """
 
     @mcp.tool()
-    def create_envelope_from_template(
+    async def create_envelope_from_template(
         template_id: str,
         email_subject: str,
         role_assignments: list[dict[str, str]],
@@ -67,12 +120,12 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
             status=status,
         )
 
-        # Create envelope
-        api_client = ds_client.get_api_client()
-        envelopes_api = EnvelopesApi(api_client)
-        account_id = ds_client.get_account_id()
+        # Create envelope (auth and API call block, so run off the event loop)
+        envelopes_api, account_id = await anyio.to_thread.run_sync(ds_client.get_envelopes_context)
 
-        result = envelopes_api.create_envelope(account_id, envelope_definition=env_def)
+        result = await anyio.to_thread.run_sync(
+            partial(envelopes_api.create_envelope, account_id, envelope_definition=env_def)
+        )
 
         return {
             "envelopeId": result.envelope_id,
@@ -81,7 +134,7 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
         }
 
     @mcp.tool()
-    def create_envelope_from_documents(
+    async def create_envelope_from_documents(
         documents: list[dict[str, Any]],
         recipients: dict[str, list[dict[str, str]]],
         email_subject: str,
@@ -96,6 +149,8 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
                 - documentId: Document ID (e.g., "1", "2")
                 - fileExtension: File extension (e.g., "pdf")
                 - documentBase64: Base64-encoded document content
+                - documentPath: (alternative to documentBase64) Server-local
+                  path to the document file, read directly by the server
             recipients: Dictionary of recipient types to lists:
                 - signers: List of signers with name, email, recipientId, routingOrder
             email_subject: Subject line for the email.
@@ -105,30 +160,10 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
         Returns:
             Dictionary with envelopeId and status.
         """
-        # Build documents
-        docs = [
-            Document(
-                name=doc.get("name"),
-                document_id=doc.get("documentId"),
-                file_extension=doc.get("fileExtension"),
-                document_base64=doc.get("documentBase64"),
-            )
-            for doc in documents
-        ]
-
-        # Build recipients
-        signers = []
-        if "signers" in recipients:
-            signers = [
-                Signer(
-                    name=s.get("name"),
-                    email=s.get("email"),
-                    recipient_id=s.get("recipientId"),
-                    routing_order=s.get("routingOrder", "1"),
-                    client_user_id=s.get("clientUserId"),
-                )
-                for s in recipients["signers"]
-            ]
+        # Build documents and recipients with the module-level helpers; map
+        # runs the loop in C and the helpers are compiled once per process
+        docs = list(map(_build_document, documents))
+        signers = list(map(_build_signer, recipients.get("signers", ())))
 
         recipient_obj = Recipients(signers=signers)
 
@@ -141,12 +176,12 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
             status=status,
         )
 
-        # Create envelope
-        api_client = ds_client.get_api_client()
-        envelopes_api = EnvelopesApi(api_client)
-        account_id = ds_client.get_account_id()
+        # Create envelope (auth and API call block, so run off the event loop)
+        envelopes_api, account_id = await anyio.to_thread.run_sync(ds_client.get_envelopes_context)
 
-        result = envelopes_api.create_envelope(account_id, envelope_definition=env_def)
+        result = await anyio.to_thread.run_sync(
+            partial(envelopes_api.create_envelope, account_id, envelope_definition=env_def)
+        )
 
         return {
             "envelopeId": result.envelope_id,
@@ -155,7 +190,7 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
         }
 
     @mcp.tool()
-    def get_envelope_status(envelope_id: str) -> dict[str, Any]:
+    async def get_envelope_status(envelope_id: str) -> dict[str, Any]:
         """Get the status and metadata of an envelope.
 
         Args:
@@ -165,11 +200,11 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
             Dictionary with envelope details including envelopeId, status,
             emailSubject, createdDateTime, sentDateTime, completedDateTime, etc.
         """
-        api_client = ds_client.get_api_client()
-        envelopes_api = EnvelopesApi(api_client)
-        account_id = ds_client.get_account_id()
+        envelopes_api, account_id = await anyio.to_thread.run_sync(ds_client.get_envelopes_context)
 
-        envelope = envelopes_api.get_envelope(account_id, envelope_id)
+        envelope = await anyio.to_thread.run_sync(
+            envelopes_api.get_envelope, account_id, envelope_id
+        )
 
         return {
             "envelopeId": envelope.envelope_id,
@@ -186,24 +221,29 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
         }
 
     @mcp.tool()
-    def list_envelopes(
+    async def list_envelopes(
         from_date: str | None = None,
         to_date: str | None = None,
         status: str | None = None,
+        count: int | None = None,
+        start_position: int | None = None,
     ) -> dict[str, Any]:
         """List envelopes with optional filters.
 
+        Large result sets are paginated: pass count and start_position, and
+        use the returned endPosition/nextUri to fetch the following page.
+
         Args:
             from_date: Start date filter (ISO 8601 format, e.g., "2024-01-01T00:00:00Z").
             to_date: End date filter (ISO 8601 format).
             status: Status filter (e.g., "sent", "delivered", "completed", "declined").
+            count: Maximum number of envelopes to return per page.
+            start_position: Zero-based index of the first envelope to return.
 
         Returns:
-            Dictionary with list of envelopes and metadata.
+            Dictionary with list of envelopes and pagination metadata.
         """
-        api_client = ds_client.get_api_client()
-        envelopes_api = EnvelopesApi(api_client)
-        account_id = ds_client.get_account_id()
+        envelopes_api, account_id = await anyio.to_thread.run_sync(ds_client.get_envelopes_context)
 
         # Build options
         options = {}
@@ -213,25 +253,24 @@ def register_envelope_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
             options["to_date"] = to_date
         if status:
             options["status"] = status
+        if count is not None:
+            options["count"] = str(count)
+        if start_position is not None:
+            options["start_position"] = str(start_position)
+
+        result = await anyio.to_thread.run_sync(
+            partial(envelopes_api.list_status_changes, account_id, **options)
+        )
 
-        result = envelopes_api.list_status_changes(account_id, **options)
-
-        envelopes = []
-        if result.envelopes:
-            envelopes = [
-                {
-                    "envelopeId": env.envelope_id,
-                    "status": env.status,
-                    "emailSubject": env.email_subject,
-                    "createdDateTime": env.created_date_time,
-                    "sentDateTime": env.sent_date_time,
-                    "completedDateTime": env.completed_date_time,
-                }
-                for env in result.envelopes
-            ]
+        envelopes = [
+            dict(zip(_ENV_KEYS, _env_fields(env), strict=True)) for env in result.envelopes or ()
+        ]
 
         return {
             "envelopes": envelopes,
             "resultSetSize": result.result_set_size,
             "totalSetSize": result.total_set_size,
+            "startPosition": result.start_position,
+            "endPosition": result.end_position,
+            "nextUri": result.next_uri,
         }
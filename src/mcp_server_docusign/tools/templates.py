@@ -1,12 +1,24 @@
 """Template management tools for DocuSign."""
 
+import operator
+from functools import partial
 from typing import Any
 
-from docusign_esign import TemplatesApi
+import anyio.to_thread
 from fastmcp import FastMCP
 
 from ..docusign_client import DocuSignClient
 
+# Row-shaping for template listings (see _ENV_KEYS in envelopes.py)
+_TMPL_KEYS = ("templateId", "name", "description", "shared", "created", "lastModified")
+_tmpl_fields = operator.attrgetter(
+    "template_id", "name", "description", "shared", "created", "last_modified"
+)
+_ROLE_KEYS = ("roleName", "name", "recipientId", "routingOrder")
+_role_fields = operator.attrgetter("role_name", "name", "recipient_id", "routing_order")
+_TMPL_DOC_KEYS = ("documentId", "name", "fileExtension", "order")
+_tmpl_doc_fields = operator.attrgetter("document_id", "name", "file_extension", "order")
+
 
 def register_template_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
     """Register template-related tools with the MCP server.
@@ -17,48 +29,55 @@ def register_template_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
     """
 
     @mcp.tool()
-    def list_templates(search_text: str | None = None) -> dict[str, Any]:
+    async def list_templates(
+        search_text: str | None = None,
+        count: int | None = None,
+        start_position: int | None = None,
+    ) -> dict[str, Any]:
         """List available DocuSign templates.
 
+        Large result sets are paginated: pass count and start_position, and
+        use the returned endPosition/nextUri to fetch the following page.
+
         Args:
             search_text: Optional search text to filter templates by name.
+            count: Maximum number of templates to return per page.
+            start_position: Zero-based index of the first template to return.
 
         Returns:
-            Dictionary with list of templates and metadata.
+            Dictionary with list of templates and pagination metadata.
         """
-        api_client = ds_client.get_api_client()
-        templates_api = TemplatesApi(api_client)
-        account_id = ds_client.get_account_id()
+        templates_api, account_id = await anyio.to_thread.run_sync(ds_client.get_templates_context)
 
         # Build options
         options = {}
         if search_text:
             options["search_text"] = search_text
+        if count is not None:
+            options["count"] = str(count)
+        if start_position is not None:
+            options["start_position"] = str(start_position)
 
-        result = templates_api.list_templates(account_id, **options)
-
-        templates = []
-        if result.envelope_templates:
-            templates = [
-                {
-                    "templateId": tmpl.template_id,
-                    "name": tmpl.name,
-                    "description": tmpl.description,
-                    "shared": tmpl.shared,
-                    "created": tmpl.created,
-                    "lastModified": tmpl.last_modified,
-                }
-                for tmpl in result.envelope_templates
-            ]
+        result = await anyio.to_thread.run_sync(
+            partial(templates_api.list_templates, account_id, **options)
+        )
+
+        templates = [
+            dict(zip(_TMPL_KEYS, _tmpl_fields(tmpl), strict=True))
+            for tmpl in result.envelope_templates or ()
+        ]
 
         return {
             "templates": templates,
             "resultSetSize": result.result_set_size,
             "totalSetSize": result.total_set_size,
+            "startPosition": result.start_position,
+            "endPosition": result.end_position,
+            "nextUri": result.next_uri,
         }
 
     @mcp.tool()
-    def get_template_definition(template_id: str) -> dict[str, Any]:
+    async def get_template_definition(template_id: str) -> dict[str, Any]:
         """Get the definition and details of a specific template.
 
         Args:
@@ -68,37 +87,23 @@ def register_template_tools(mcp: FastMCP, ds_client: DocuSignClient) -> None:
             Dictionary with complete template details including roles, tabs,
             documents, and other metadata.
         """
-        api_client = ds_client.get_api_client()
-        templates_api = TemplatesApi(api_client)
-        account_id = ds_client.get_account_id()
+        templates_api, account_id = await anyio.to_thread.run_sync(ds_client.get_templates_context)
 
-        template = templates_api.get(account_id, template_id)
+        template = await anyio.to_thread.run_sync(templates_api.get, account_id, template_id)
 
         # Extract recipients/roles
         roles = []
         if template.recipients and template.recipients.signers:
             roles = [
-                {
-                    "roleName": signer.role_name,
-                    "name": signer.name,
-                    "recipientId": signer.recipient_id,
-                    "routingOrder": signer.routing_order,
-                }
+                dict(zip(_ROLE_KEYS, _role_fields(signer), strict=True))
                 for signer in template.recipients.signers
             ]
 
         # Extract documents
-        documents = []
-        if template.documents:
-            documents = [
-                {
-                    "documentId": doc.document_id,
-                    "name": doc.name,
-                    "fileExtension": doc.file_extension,
-                    "order": doc.order,
-                }
-                for doc in template.documents
-            ]
+        documents = [
+            dict(zip(_TMPL_DOC_KEYS, _tmpl_doc_fields(doc), strict=True))
+            for doc in template.documents or ()
+        ]
 
         return {
             "templateId": template.template_id,
@@ -0,0 +1,190 @@
+"""Shared fixtures for DocuSign MCP server unit tests."""
+
+import functools
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+
+@functools.cache
+def _integration_enabled() -> bool:
+    """True when real DocuSign credentials are configured.
+
+    Loads .env lazily, so runs that never collect the integration tests do
+    no dotenv I/O at all. Requires either DS_PRIVATE_KEY or
+    DS_PRIVATE_KEY_PATH alongside the integration key and user ID.
+    """
+    # CI unit-test jobs set SKIP_INTEGRATION=1 to skip even the .env probe
+    if os.environ.get("SKIP_INTEGRATION") == "1":
+        return False
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        pass  # No dotenv: credentials must already be in the environment
+    else:
+        load_dotenv(Path(__file__).parent.parent / ".env")
+    return all(
+        [
+            os.getenv("DS_INTEGRATION_KEY"),
+            os.getenv("DS_USER_ID"),
+            os.getenv("DS_PRIVATE_KEY") or os.getenv("DS_PRIVATE_KEY_PATH"),
+        ]
+    )
+
+
+# Cheapest-first, so --exitfirst surfaces broken credentials in seconds
+# instead of after the slower refresh/list round-trips
+_INTEGRATION_TEST_ORDER = [
+    "test_jwt_authentication",
+    "test_get_account_id",
+    "test_base_uri_discovery",
+    "test_token_refresh",
+    "test_list_templates",
+]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Gate and order the integration tests.
+
+    The credential check (and the .env parse behind it) runs only when
+    integration tests were actually collected, and those tests run in
+    _INTEGRATION_TEST_ORDER rather than definition order.
+    """
+    positions = [i for i, item in enumerate(items) if item.path.name == "test_integration.py"]
+    if not positions:
+        return
+
+    rank = {name: i for i, name in enumerate(_INTEGRATION_TEST_ORDER)}
+    ordered = sorted((items[i] for i in positions), key=lambda item: rank.get(item.name, len(rank)))
+    for pos, item in zip(positions, ordered, strict=True):
+        items[pos] = item
+
+    if _integration_enabled():
+        return
+    skip = pytest.mark.skip(
+        reason="Integration tests disabled. Create .env file with credentials to enable."
+    )
+    for i in positions:
+        items[i].add_marker(skip)
+
+
+class _StubDocuSignClient:
+    """Minimal stand-in for DocuSignClient used by the unit tests.
+
+    A plain class rather than Mock(spec=DocuSignClient): spec'd mocks
+    introspect the whole client class and re-check call signatures on every
+    call just to hand back two constants. Tests point the *_context
+    attributes at whatever mock API object the tool under test should see.
+    """
+
+    def __init__(self):
+        self.envelopes_context = (None, "acct-123")
+        self.templates_context = (None, "acct-123")
+
+    def get_envelopes_context(self):
+        return self.envelopes_context
+
+    def get_templates_context(self):
+        return self.templates_context
+
+    def get_account_id(self):
+        return "acct-123"
+
+    def get_api_client(self):
+        return object()
+
+
+def _build_mock_mcp() -> Mock:
+    """Create a mock FastMCP instance that records registered tool functions."""
+    mcp = Mock()
+    registered_funcs = {}
+
+    def tool_decorator():
+        def wrapper(func):
+            registered_funcs[func.__name__] = func
+            return func
+
+        return wrapper
+
+    mcp.tool = tool_decorator
+    mcp._registered_funcs = registered_funcs
+    return mcp
+
+
+# One stub for the whole session; registered tools close over it and tests
+# re-point its *_context attributes per test
+_STUB_DS_CLIENT = _StubDocuSignClient()
+
+
+@functools.cache
+def _registered(kind: str) -> dict:
+    """Register a tool module once per session and return its functions.
+
+    Registration builds every tool closure and applies the decorator, so
+    caching it amortizes that cost across all tests. Imports happen here
+    (not at module top) so collecting the suite doesn't pay for
+    fastmcp/docusign_esign when these tests are deselected.
+    """
+    if kind == "envelopes":
+        from mcp_server_docusign.tools.envelopes import register_envelope_tools as register
+    elif kind == "templates":
+        from mcp_server_docusign.tools.templates import register_template_tools as register
+    elif kind == "documents":
+        from mcp_server_docusign.tools.documents import register_document_tools as register
+    else:
+        raise ValueError(f"Unknown tool module: {kind}")
+    mcp = _build_mock_mcp()
+    register(mcp, _STUB_DS_CLIENT)
+    return mcp._registered_funcs
+
+
+@pytest.fixture(scope="session")
+def mock_ds_client():
+    """The shared stub DocuSign client the registered tools close over."""
+    return _STUB_DS_CLIENT
+
+
+@pytest.fixture(scope="session")
+def registered_envelope_funcs():
+    """The envelope tool functions, registered once per session."""
+    return _registered("envelopes")
+
+
+@pytest.fixture(scope="session")
+def registered_template_funcs():
+    """The template tool functions, registered once per session."""
+    return _registered("templates")
+
+
+@pytest.fixture(scope="session")
+def registered_document_funcs():
+    """The document tool functions, registered once per session."""
+    return _registered("documents")
+
+
+@functools.lru_cache(maxsize=1)
+def _session_config():
+    """Parse .env and build the integration config once per session."""
+    _integration_enabled()  # loads .env (itself cached)
+    from mcp_server_docusign.config import DocuSignConfig
+
+    return DocuSignConfig.from_env()
+
+
+@pytest.fixture(scope="session")
+def ds_client():
+    """Create a DocuSign client with real credentials from environment.
+
+    Session-scoped so every integration test shares one JWT round-trip.
+    """
+    from mcp_server_docusign.docusign_client import DocuSignClient
+
+    return DocuSignClient(_session_config())
+
+
+@pytest.fixture(scope="session")
+def authed_api_client(ds_client):
+    """Authenticate the shared client once and return its API client."""
+    return ds_client.get_api_client()
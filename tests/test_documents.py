@@ -1,112 +1,122 @@
 """Tests for document tools."""
 
 import base64
-from unittest.mock import Mock, patch
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-import pytest
+# Read-only API fixtures shared across tests (see test_envelopes.py)
+MOCK_DOCUMENT = SimpleNamespace(
+    document_id="1",
+    name="contract.pdf",
+    type="content",
+    uri="/documents/1",
+    order="1",
+    pages="5",
+)
 
-from mcp_server_docusign.docusign_client import DocuSignClient
-from mcp_server_docusign.tools.documents import register_document_tools
+MOCK_DOCUMENTS_LIST = SimpleNamespace(envelope_documents=[MOCK_DOCUMENT])
 
 
-class MockDocument:
-    """Mock document object."""
-
-    def __init__(self):
-        self.document_id = "1"
-        self.name = "contract.pdf"
-        self.type = "content"
-        self.uri = "/documents/1"
-        self.order = "1"
-        self.pages = "5"
+async def test_list_envelope_documents(registered_document_funcs, mock_ds_client):
+    """Test listing envelope documents."""
+    mock_api = Mock()
+    mock_ds_client.envelopes_context = (mock_api, "acct-123")
+    mock_api.list_documents.return_value = MOCK_DOCUMENTS_LIST
 
+    # Get the registered function
+    func = registered_document_funcs["list_envelope_documents"]
 
-class MockDocumentsListResult:
-    """Mock documents list result."""
+    # Call it
+    result = await func(envelope_id="env123")
 
-    def __init__(self):
-        self.envelope_documents = [MockDocument()]
+    # Verify result
+    assert result["envelopeId"] == "env123"
+    assert len(result["documents"]) == 1
+    assert result["documents"][0]["documentId"] == "1"
+    assert result["documents"][0]["name"] == "contract.pdf"
 
+    # Verify API was called
+    mock_api.list_documents.assert_called_once_with("acct-123", "env123")
 
-@pytest.fixture
-def mock_ds_client():
-    """Create a mock DocuSign client."""
-    client = Mock(spec=DocuSignClient)
-    client.get_account_id.return_value = "acct-123"
-    client.get_api_client.return_value = Mock()
-    return client
 
+async def test_download_envelope_document(registered_document_funcs, mock_ds_client):
+    """Test downloading an envelope document."""
+    test_content = b"PDF content here"
 
-@pytest.fixture
-def mock_mcp():
-    """Create a mock FastMCP instance."""
-    mcp = Mock()
-    registered_funcs = {}
+    mock_api = Mock()
+    mock_ds_client.envelopes_context = (mock_api, "acct-123")
+    mock_api.get_document.return_value = test_content
 
-    def tool_decorator():
-        def wrapper(func):
-            registered_funcs[func.__name__] = func
-            return func
+    # Get the registered function
+    func = registered_document_funcs["download_envelope_document"]
 
-        return wrapper
+    # Call it
+    result = await func(envelope_id="env123", document_id="1")
 
-    mcp.tool = tool_decorator
-    mcp._registered_funcs = registered_funcs
-    return mcp
+    # Verify result
+    assert result["envelopeId"] == "env123"
+    assert result["documentId"] == "1"
+    assert result["sizeBytes"] == len(test_content)
 
+    # Verify base64 encoding
+    decoded = base64.b64decode(result["contentBase64"])
+    assert decoded == test_content
 
-def test_list_envelope_documents(mock_mcp, mock_ds_client):
-    """Test listing envelope documents."""
-    with patch("mcp_server_docusign.tools.documents.EnvelopesApi") as mock_api_class:
-        mock_api = Mock()
-        mock_api.list_documents.return_value = MockDocumentsListResult()
-        mock_api_class.return_value = mock_api
+    # Verify API was called
+    mock_api.get_document.assert_called_once_with("acct-123", "1", "env123")
 
-        # Register tools
-        register_document_tools(mock_mcp, mock_ds_client)
 
-        # Get the registered function
-        func = mock_mcp._registered_funcs["list_envelope_documents"]
+async def test_download_envelope_document_large_spills_to_disk(
+    registered_document_funcs, mock_ds_client
+):
+    """Test that large documents are written to a temp file instead of inlined."""
+    test_content = b"x" * 64
 
-        # Call it
-        result = func(envelope_id="env123")
+    mock_api = Mock()
+    mock_ds_client.envelopes_context = (mock_api, "acct-123")
+    mock_api.get_document.return_value = test_content
 
-        # Verify result
-        assert result["envelopeId"] == "env123"
-        assert len(result["documents"]) == 1
-        assert result["documents"][0]["documentId"] == "1"
-        assert result["documents"][0]["name"] == "contract.pdf"
+    # Get the registered function
+    func = registered_document_funcs["download_envelope_document"]
 
-        # Verify API was called
-        mock_api.list_documents.assert_called_once_with("acct-123", "env123")
+    # Call it with a threshold smaller than the content
+    result = await func(envelope_id="env123", document_id="1", max_inline_bytes=16)
 
+    # Verify the content went to disk, not inline
+    assert "contentBase64" not in result
+    assert result["sizeBytes"] == len(test_content)
 
-def test_download_envelope_document(mock_mcp, mock_ds_client):
-    """Test downloading an envelope document."""
-    test_content = b"PDF content here"
+    content_path = Path(result["contentPath"])
+    try:
+        assert content_path.read_bytes() == test_content
+    finally:
+        content_path.unlink()
 
-    with patch("mcp_server_docusign.tools.documents.EnvelopesApi") as mock_api_class:
-        mock_api = Mock()
-        mock_api.get_document.return_value = test_content
-        mock_api_class.return_value = mock_api
 
-        # Register tools
-        register_document_tools(mock_mcp, mock_ds_client)
+async def test_download_all_envelope_documents(registered_document_funcs, mock_ds_client):
+    """Test the fused list-and-download tool."""
+    test_content = b"PDF content here"
 
-        # Get the registered function
-        func = mock_mcp._registered_funcs["download_envelope_document"]
+    mock_api = Mock()
+    mock_ds_client.envelopes_context = (mock_api, "acct-123")
+    mock_api.list_documents.return_value = MOCK_DOCUMENTS_LIST
+    mock_api.get_document.return_value = test_content
 
-        # Call it
-        result = func(envelope_id="env123", document_id="1")
+    # Get the registered function
+    func = registered_document_funcs["download_all_envelope_documents"]
 
-        # Verify result
-        assert result["envelopeId"] == "env123"
-        assert result["documentId"] == "1"
-        assert result["sizeBytes"] == len(test_content)
+    # Call it
+    result = await func(envelope_id="env123")
 
-        # Verify base64 encoding
-        decoded = base64.b64decode(result["contentBase64"])
-        assert decoded == test_content
+    # Verify result: one document, downloaded inline
+    assert result["envelopeId"] == "env123"
+    assert len(result["documents"]) == 1
+    doc = result["documents"][0]
+    assert doc["documentId"] == "1"
+    assert doc["name"] == "contract.pdf"
+    assert base64.b64decode(doc["contentBase64"]) == test_content
 
-        # Verify API was called
-        mock_api.get_document.assert_called_once_with("acct-123", "1", "env123")
+    # Verify both API calls happened
+    mock_api.list_documents.assert_called_once_with("acct-123", "env123")
+    mock_api.get_document.assert_called_once_with("acct-123", "1", "env123")
@@ -1,154 +1,170 @@
 """Tests for envelope tools."""
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-from mcp_server_docusign.docusign_client import DocuSignClient
-from mcp_server_docusign.tools.envelopes import register_envelope_tools
-
-
-class MockEnvelopeResult:
-    """Mock envelope result."""
-
-    def __init__(self, envelope_id="env123", status="sent"):
-        self.envelope_id = envelope_id
-        self.status = status
-        self.status_date_time = "2024-01-01T10:00:00Z"
-
-
-class MockEnvelope:
-    """Mock envelope object."""
-
-    def __init__(self):
-        self.envelope_id = "env123"
-        self.status = "sent"
-        self.email_subject = "Test Subject"
-        self.email_blurb = "Test Blurb"
-        self.created_date_time = "2024-01-01T09:00:00Z"
-        self.sent_date_time = "2024-01-01T10:00:00Z"
-        self.delivered_date_time = None
-        self.signed_date_time = None
-        self.completed_date_time = None
-        self.declined_date_time = None
-        self.voided_date_time = None
-
-
-class MockEnvelopesListResult:
-    """Mock envelopes list result."""
-
-    def __init__(self):
-        self.result_set_size = "1"
-        self.total_set_size = "1"
-        self.envelopes = [MockEnvelope()]
-
-
-@pytest.fixture
-def mock_ds_client():
-    """Create a mock DocuSign client."""
-    client = Mock(spec=DocuSignClient)
-    client.get_account_id.return_value = "acct-123"
-    client.get_api_client.return_value = Mock()
-    return client
-
-
-@pytest.fixture
-def mock_mcp():
-    """Create a mock FastMCP instance."""
-    mcp = Mock()
-    # Store registered functions
-    registered_funcs = {}
-
-    def tool_decorator():
-        def wrapper(func):
-            registered_funcs[func.__name__] = func
-            return func
-
-        return wrapper
-
-    mcp.tool = tool_decorator
-    mcp._registered_funcs = registered_funcs
-    return mcp
-
-
-def test_create_envelope_from_template(mock_mcp, mock_ds_client):
-    """Test creating an envelope from a template."""
-    with patch("mcp_server_docusign.tools.envelopes.EnvelopesApi") as mock_api_class:
-        mock_api = Mock()
-        mock_api.create_envelope.return_value = MockEnvelopeResult()
-        mock_api_class.return_value = mock_api
-
-        # Register tools
-        register_envelope_tools(mock_mcp, mock_ds_client)
-
-        # Get the registered function
-        func = mock_mcp._registered_funcs["create_envelope_from_template"]
-
-        # Call it
-        result = func(
-            template_id="tmpl-123",
-            email_subject="Please sign",
-            role_assignments=[
+# Read-only API fixtures shared across tests. SimpleNamespace singletons
+# instead of per-test class instances: tests only read attributes, so
+# aliasing is safe and skips the per-test allocations.
+MOCK_ENVELOPE_RESULT = SimpleNamespace(
+    envelope_id="env123",
+    status="sent",
+    status_date_time="2024-01-01T10:00:00Z",
+)
+
+MOCK_ENVELOPE = SimpleNamespace(
+    envelope_id="env123",
+    status="sent",
+    email_subject="Test Subject",
+    email_blurb="Test Blurb",
+    created_date_time="2024-01-01T09:00:00Z",
+    sent_date_time="2024-01-01T10:00:00Z",
+    delivered_date_time=None,
+    signed_date_time=None,
+    completed_date_time=None,
+    declined_date_time=None,
+    voided_date_time=None,
+)
+
+MOCK_ENVELOPES_LIST = SimpleNamespace(
+    result_set_size="1",
+    total_set_size="1",
+    start_position="0",
+    end_position="0",
+    next_uri=None,
+    envelopes=[MOCK_ENVELOPE],
+)
+
+
+# (tool_name, api_method, api_return, call_kwargs, check) — the three CRUD
+# tools share the same wire-up/call/verify shape, so they run as one
+# parametrized test
+ENVELOPE_TOOL_CASES = [
+    (
+        "create_envelope_from_template",
+        "create_envelope",
+        MOCK_ENVELOPE_RESULT,
+        {
+            "template_id": "tmpl-123",
+            "email_subject": "Please sign",
+            "role_assignments": [
                 {"roleName": "Signer1", "name": "John Doe", "email": "john@example.com"}
             ],
-            status="sent",
-        )
-
-        # Verify result
-        assert result["envelopeId"] == "env123"
-        assert result["status"] == "sent"
-
-        # Verify API was called correctly
-        mock_api.create_envelope.assert_called_once()
-        call_args = mock_api.create_envelope.call_args
-        assert call_args[0][0] == "acct-123"  # account_id
-
-
-def test_get_envelope_status(mock_mcp, mock_ds_client):
-    """Test getting envelope status."""
-    with patch("mcp_server_docusign.tools.envelopes.EnvelopesApi") as mock_api_class:
-        mock_api = Mock()
-        mock_api.get_envelope.return_value = MockEnvelope()
-        mock_api_class.return_value = mock_api
-
-        # Register tools
-        register_envelope_tools(mock_mcp, mock_ds_client)
-
-        # Get the registered function
-        func = mock_mcp._registered_funcs["get_envelope_status"]
-
-        # Call it
-        result = func(envelope_id="env123")
-
-        # Verify result
-        assert result["envelopeId"] == "env123"
-        assert result["status"] == "sent"
-        assert result["emailSubject"] == "Test Subject"
-
-        # Verify API was called
-        mock_api.get_envelope.assert_called_once_with("acct-123", "env123")
-
-
-def test_list_envelopes(mock_mcp, mock_ds_client):
-    """Test listing envelopes."""
-    with patch("mcp_server_docusign.tools.envelopes.EnvelopesApi") as mock_api_class:
-        mock_api = Mock()
-        mock_api.list_status_changes.return_value = MockEnvelopesListResult()
-        mock_api_class.return_value = mock_api
-
-        # Register tools
-        register_envelope_tools(mock_mcp, mock_ds_client)
-
-        # Get the registered function
-        func = mock_mcp._registered_funcs["list_envelopes"]
-
-        # Call it
-        result = func(status="sent")
-
-        # Verify result
-        assert len(result["envelopes"]) == 1
-        assert result["envelopes"][0]["envelopeId"] == "env123"
-        assert result["resultSetSize"] == "1"
-
-        # Verify API was called
-        mock_api.list_status_changes.assert_called_once()
+            "status": "sent",
+        },
+        lambda r: r["envelopeId"] == "env123" and r["status"] == "sent",
+    ),
+    (
+        "get_envelope_status",
+        "get_envelope",
+        MOCK_ENVELOPE,
+        {"envelope_id": "env123"},
+        lambda r: (
+            r["envelopeId"] == "env123"
+            and r["status"] == "sent"
+            and r["emailSubject"] == "Test Subject"
+        ),
+    ),
+    (
+        "list_envelopes",
+        "list_status_changes",
+        MOCK_ENVELOPES_LIST,
+        {"status": "sent"},
+        lambda r: (
+            len(r["envelopes"]) == 1
+            and r["envelopes"][0]["envelopeId"] == "env123"
+            and r["resultSetSize"] == "1"
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("tool_name", "api_method", "api_return", "call_kwargs", "check"),
+    ENVELOPE_TOOL_CASES,
+    ids=[case[0] for case in ENVELOPE_TOOL_CASES],
+)
+async def test_envelope_tool(
+    registered_envelope_funcs, mock_ds_client, tool_name, api_method, api_return, call_kwargs, check
+):
+    """Each envelope tool calls its API method once and shapes the result."""
+    mock_api = Mock()
+    mock_ds_client.envelopes_context = (mock_api, "acct-123")
+    # Bind the method mock and tool function once up front
+    api_call = getattr(mock_api, api_method)
+    api_call.return_value = api_return
+    func = registered_envelope_funcs[tool_name]
+
+    result = await func(**call_kwargs)
+
+    # Verify result
+    assert check(result)
+
+    # Verify the API was called once, against the resolved account
+    api_call.assert_called_once()
+    assert api_call.call_args[0][0] == "acct-123"  # account_id
+
+
+async def test_create_envelope_from_documents_path(
+    registered_envelope_funcs, mock_ds_client, tmp_path
+):
+    """Test that documentPath content is read and base64-encoded server-side."""
+    import base64
+
+    doc_file = tmp_path / "contract.pdf"
+    doc_file.write_bytes(b"PDF content here")
+
+    mock_api = Mock()
+    mock_ds_client.envelopes_context = (mock_api, "acct-123")
+    mock_api.create_envelope.return_value = MOCK_ENVELOPE_RESULT
+
+    # Get the registered function
+    func = registered_envelope_funcs["create_envelope_from_documents"]
+
+    # Call it with a path instead of inline base64
+    result = await func(
+        documents=[
+            {
+                "name": "contract.pdf",
+                "documentId": "1",
+                "fileExtension": "pdf",
+                "documentPath": str(doc_file),
+            }
+        ],
+        recipients={"signers": [{"name": "John Doe", "email": "john@example.com"}]},
+        email_subject="Please sign",
+    )
+
+    # Verify result
+    assert result["envelopeId"] == "env123"
+
+    # Verify the file content was encoded into the envelope definition
+    env_def = mock_api.create_envelope.call_args[1]["envelope_definition"]
+    assert env_def.documents[0].document_base64 == base64.b64encode(b"PDF content here").decode(
+        "ascii"
+    )
+
+
+async def test_list_envelopes_pagination(registered_envelope_funcs, mock_ds_client):
+    """Test that pagination options are forwarded to the API."""
+    mock_api = Mock()
+    mock_ds_client.envelopes_context = (mock_api, "acct-123")
+    mock_api.list_status_changes.return_value = MOCK_ENVELOPES_LIST
+
+    # Get the registered function
+    func = registered_envelope_funcs["list_envelopes"]
+
+    # Call it with pagination params
+    result = await func(count=50, start_position=100)
+
+    # Verify pagination metadata is returned
+    assert result["startPosition"] == "0"
+    assert result["endPosition"] == "0"
+    assert result["nextUri"] is None
+
+    # Verify options were forwarded
+    call_kwargs = mock_api.list_status_changes.call_args[1]
+    assert call_kwargs["count"] == "50"
+    assert call_kwargs["start_position"] == "100"
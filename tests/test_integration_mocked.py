@@ -0,0 +1,155 @@
+"""Network-free tests for the JWT authentication and discovery paths.
+
+These mirror the opt-in tests in test_integration.py but fake the OAuth
+token endpoint and the userinfo lookup, so CI exercises authentication,
+discovery, refresh, and the discovery cache without credentials or network
+access.
+"""
+
+import base64
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+USER_INFO = SimpleNamespace(
+    accounts=[SimpleNamespace(account_id="acct-123", base_uri="https://demo.docusign.net")]
+)
+
+
+def _token_response(token):
+    """Shape a successful httpx token-endpoint response."""
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.json.return_value = {"access_token": token, "expires_in": 3600}
+    return response
+
+
+@pytest.fixture(scope="module")
+def private_key_b64():
+    """Generate a throwaway RSA key, base64-encoded like DS_PRIVATE_KEY."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    return base64.b64encode(pem).decode("ascii")
+
+
+@pytest.fixture
+def mocked_ds_client(private_key_b64, monkeypatch, tmp_path):
+    """A real DocuSignClient wired to fake token and userinfo endpoints.
+
+    The token endpoint is patched at the httpx layer (the client posts the
+    RFC 7523 assertion directly) and discovery at the SDK's get_user_info.
+    Yields (client, post_mock).
+    """
+    # Keep the discovery cache inside the test sandbox
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    # Isolate from ambient credentials: a developer's .env (loaded into
+    # os.environ by the integration gate) would otherwise leak settings like
+    # DS_PRIVATE_KEY_PATH into the config and clash with the key built here
+    for var in (
+        "DS_AUTH_BASE",
+        "DS_INTEGRATION_KEY",
+        "DS_USER_ID",
+        "DS_OAUTH_SCOPE",
+        "DS_PRIVATE_KEY",
+        "DS_PRIVATE_KEY_PATH",
+        "DS_TOKEN_EXP_SECS",
+    ):
+        monkeypatch.delenv(var, raising=False)
+
+    from mcp_server_docusign.config import DocuSignConfig
+    from mcp_server_docusign.docusign_client import DocuSignClient
+
+    config = DocuSignConfig(
+        integration_key="int-key",
+        user_id="user-guid",
+        private_key=private_key_b64,
+    )
+    client = DocuSignClient(config)
+
+    with (
+        patch(
+            "mcp_server_docusign.docusign_client.httpx.post",
+            side_effect=[_token_response("token-1"), _token_response("token-2")],
+        ) as post,
+        patch(
+            "mcp_server_docusign.docusign_client.ApiClient.get_user_info",
+            return_value=USER_INFO,
+        ),
+    ):
+        yield client, post
+
+
+def test_jwt_authentication(mocked_ds_client):
+    """Authentication posts a JWT-bearer assertion and stores the token."""
+    client, post = mocked_ds_client
+
+    api_client = client.get_api_client()
+
+    assert api_client is not None
+    assert client._token == "token-1"
+
+    body = post.call_args[1]["data"]
+    assert body["grant_type"] == "urn:ietf:params:oauth:grant-type:jwt-bearer"
+    assert body["assertion"]
+
+
+def test_get_account_id(mocked_ds_client):
+    """The discovered default account ID is returned."""
+    client, _ = mocked_ds_client
+
+    assert client.get_account_id() == "acct-123"
+
+
+def test_base_uri_discovery(mocked_ds_client):
+    """The REST base URI is derived from the userinfo response."""
+    client, _ = mocked_ds_client
+
+    client.get_api_client()
+
+    assert client.config.base_uri == "https://demo.docusign.net/restapi"
+
+
+def test_token_refresh(mocked_ds_client):
+    """An expired token is replaced on the next call."""
+    client, _ = mocked_ds_client
+
+    client.get_api_client()
+    first_token = client._token
+
+    # Force token to be considered expired
+    client._token_expiry = 0
+
+    client.get_api_client()
+
+    assert client._token == "token-2"
+    assert client._token != first_token
+
+
+def test_discovery_cache_shared_across_clients(mocked_ds_client, private_key_b64):
+    """A second client with the same credentials skips rediscovery."""
+    client, _ = mocked_ds_client
+    client.get_api_client()  # authenticates and writes the discovery cache
+
+    from mcp_server_docusign.config import DocuSignConfig
+    from mcp_server_docusign.docusign_client import DocuSignClient
+
+    second = DocuSignClient(
+        DocuSignConfig(
+            integration_key="int-key",
+            user_id="user-guid",
+            private_key=private_key_b64,
+        )
+    )
+
+    # Base URI and account come straight from the on-disk cache, pre-auth
+    assert second.config.base_uri == "https://demo.docusign.net/restapi"
+    assert second.config.account_id == "acct-123"
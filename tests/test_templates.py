@@ -1,127 +1,95 @@
 """Tests for template tools."""
 
-from unittest.mock import Mock, patch
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-from mcp_server_docusign.docusign_client import DocuSignClient
-from mcp_server_docusign.tools.templates import register_template_tools
-
-
-class MockTemplate:
-    """Mock template object."""
-
-    def __init__(self):
-        self.template_id = "tmpl-123"
-        self.name = "Test Template"
-        self.description = "A test template"
-        self.shared = "false"
-        self.created = "2024-01-01"
-        self.last_modified = "2024-01-02"
-
-
-class MockTemplateDetails(MockTemplate):
-    """Mock template with details."""
-
-    def __init__(self):
-        super().__init__()
-        self.email_subject = "Please sign"
-        self.email_blurb = "Important document"
-        self.recipients = Mock()
-        self.recipients.signers = [
-            Mock(
-                role_name="Signer1",
-                name="John Doe",
-                recipient_id="1",
-                routing_order="1",
-            )
-        ]
-        self.documents = [Mock(document_id="1", name="doc.pdf", file_extension="pdf", order="1")]
-
-
-class MockTemplatesListResult:
-    """Mock templates list result."""
-
-    def __init__(self):
-        self.result_set_size = "1"
-        self.total_set_size = "1"
-        self.envelope_templates = [MockTemplate()]
-
-
-@pytest.fixture
-def mock_ds_client():
-    """Create a mock DocuSign client."""
-    client = Mock(spec=DocuSignClient)
-    client.get_account_id.return_value = "acct-123"
-    client.get_api_client.return_value = Mock()
-    return client
-
-
-@pytest.fixture
-def mock_mcp():
-    """Create a mock FastMCP instance."""
-    mcp = Mock()
-    registered_funcs = {}
-
-    def tool_decorator():
-        def wrapper(func):
-            registered_funcs[func.__name__] = func
-            return func
-
-        return wrapper
-
-    mcp.tool = tool_decorator
-    mcp._registered_funcs = registered_funcs
-    return mcp
-
-
-def test_list_templates(mock_mcp, mock_ds_client):
-    """Test listing templates."""
-    with patch("mcp_server_docusign.tools.templates.TemplatesApi") as mock_api_class:
-        mock_api = Mock()
-        mock_api.list_templates.return_value = MockTemplatesListResult()
-        mock_api_class.return_value = mock_api
-
-        # Register tools
-        register_template_tools(mock_mcp, mock_ds_client)
-
-        # Get the registered function
-        func = mock_mcp._registered_funcs["list_templates"]
-
-        # Call it
-        result = func()
-
-        # Verify result
-        assert len(result["templates"]) == 1
-        assert result["templates"][0]["templateId"] == "tmpl-123"
-        assert result["templates"][0]["name"] == "Test Template"
-
-        # Verify API was called
-        mock_api.list_templates.assert_called_once_with("acct-123")
-
-
-def test_get_template_definition(mock_mcp, mock_ds_client):
-    """Test getting template definition."""
-    with patch("mcp_server_docusign.tools.templates.TemplatesApi") as mock_api_class:
-        mock_api = Mock()
-        mock_api.get.return_value = MockTemplateDetails()
-        mock_api_class.return_value = mock_api
-
-        # Register tools
-        register_template_tools(mock_mcp, mock_ds_client)
-
-        # Get the registered function
-        func = mock_mcp._registered_funcs["get_template_definition"]
-
-        # Call it
-        result = func(template_id="tmpl-123")
-
-        # Verify result
-        assert result["templateId"] == "tmpl-123"
-        assert result["name"] == "Test Template"
-        assert len(result["roles"]) == 1
-        assert result["roles"][0]["roleName"] == "Signer1"
-        assert len(result["documents"]) == 1
-
-        # Verify API was called
-        mock_api.get.assert_called_once_with("acct-123", "tmpl-123")
+# Plain namedtuples for sub-objects the tools only read attributes from —
+# far lighter than a Mock per signer/document
+Signer = namedtuple("Signer", "role_name name recipient_id routing_order")
+Document = namedtuple("Document", "document_id name file_extension order")
+
+# Read-only API fixtures shared across tests (see test_envelopes.py)
+MOCK_TEMPLATE = SimpleNamespace(
+    template_id="tmpl-123",
+    name="Test Template",
+    description="A test template",
+    shared="false",
+    created="2024-01-01",
+    last_modified="2024-01-02",
+)
+
+MOCK_TEMPLATE_DETAILS = SimpleNamespace(
+    **vars(MOCK_TEMPLATE),
+    email_subject="Please sign",
+    email_blurb="Important document",
+    recipients=SimpleNamespace(signers=[Signer("Signer1", "John Doe", "1", "1")]),
+    documents=[Document("1", "doc.pdf", "pdf", "1")],
+)
+
+MOCK_TEMPLATES_LIST = SimpleNamespace(
+    result_set_size="1",
+    total_set_size="1",
+    start_position="0",
+    end_position="0",
+    next_uri=None,
+    envelope_templates=[MOCK_TEMPLATE],
+)
+
+
+# (tool_name, api_method, api_return, call_kwargs, check) — mirrors
+# ENVELOPE_TOOL_CASES in test_envelopes.py
+TEMPLATE_TOOL_CASES = [
+    (
+        "list_templates",
+        "list_templates",
+        MOCK_TEMPLATES_LIST,
+        {},
+        lambda r: (
+            len(r["templates"]) == 1
+            and r["templates"][0]["templateId"] == "tmpl-123"
+            and r["templates"][0]["name"] == "Test Template"
+        ),
+    ),
+    (
+        "get_template_definition",
+        "get",
+        MOCK_TEMPLATE_DETAILS,
+        {"template_id": "tmpl-123"},
+        lambda r: (
+            r["templateId"] == "tmpl-123"
+            and r["name"] == "Test Template"
+            and len(r["roles"]) == 1
+            and r["roles"][0]["roleName"] == "Signer1"
+            and len(r["documents"]) == 1
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("tool_name", "api_method", "api_return", "call_kwargs", "check"),
+    TEMPLATE_TOOL_CASES,
+    ids=[case[0] for case in TEMPLATE_TOOL_CASES],
+)
+async def test_template_tool(
+    registered_template_funcs, mock_ds_client, tool_name, api_method, api_return, call_kwargs, check
+):
+    """Each template tool calls its API method once and shapes the result."""
+    mock_api = Mock()
+    mock_ds_client.templates_context = (mock_api, "acct-123")
+    # Bind the method mock and tool function once up front
+    api_call = getattr(mock_api, api_method)
+    api_call.return_value = api_return
+    func = registered_template_funcs[tool_name]
+
+    result = await func(**call_kwargs)
+
+    # Verify result
+    assert check(result)
+
+    # Verify the API was called once, against the resolved account
+    api_call.assert_called_once()
+    assert api_call.call_args[0][0] == "acct-123"  # account_id